@@ -125,6 +125,13 @@ def cmd_interface(
         case_sensitive=__CASE_SENSITIVE,
         help="Wipe out root directory (if exists) in case of a collision",
     ),
+    plan: bool = typer.Option(
+        False,
+        "--plan",
+        show_default=False,
+        case_sensitive=__CASE_SENSITIVE,
+        help="Walk through the source without writing, and estimate cost of a run",
+    ),
     version: bool = typer.Option(
         None,
         "--version",
@@ -145,6 +152,7 @@ def cmd_interface(
             include_extensions=not rem_extensions,
             live_updates=not hide_updates,
             outstream=outstream,
+            plan=plan,
         )
 
         if not source or len(source) == 0:
@@ -158,14 +166,14 @@ def cmd_interface(
                 err=True,
             )
 
-        __check_collisions(
-            force=force,
-            dst=join_path(
-                destination,
-                root_name if root_name else drive_handler.drive_name(source),
-            ),
+        root = join_path(
+            destination,
+            root_name if root_name else drive_handler.drive_name(source),
         )
 
+        if not plan:
+            __check_collisions(force=force, dst=root)
+
         drive_handler.walk(
             source=source,
             change_dir=file_handler.switch_dir,
@@ -174,6 +182,18 @@ def cmd_interface(
             custom_root=root_name,
         )
 
+    if plan:
+        typer.secho(
+            f"Planned run for: {root}\n"
+            + f"{file_handler.plan_report(root)}\n"
+            + f"Estimated API calls: {drive_handler.api_calls}\n"
+            + "Estimated wall time: "
+            + f"{drive_handler.api_calls * drive_handler.avg_latency:.1f}s "
+            + f"(avg. {drive_handler.avg_latency * 1000:.0f}ms per call)",
+            fg=typer.colors.GREEN,
+        )
+        return
+
     typer.secho(
         f"Completed generating strm files\nFiles generated in: {destination}",
         fg=typer.colors.GREEN,
@@ -3,10 +3,12 @@ from os.path import exists as path_exists
 from os.path import join as join_path
 from pickle import dump as dump_pickle
 from pickle import load as load_pickle
+from time import perf_counter
 from typing import Any, Callable, Dict, List, Optional, Tuple
 
 import googleapiclient
 import googleapiclient.discovery as discovery
+import googleapiclient.http
 import typer
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
@@ -25,6 +27,11 @@ class DriveHandler:
         # to reduce API calls. Can be used for teamdrives, and normal directories
         self.dirs: Dict[str, str] = {}
 
+        # Number of calls made to the Drive API, and total time (in seconds) spent
+        # waiting on them. Used to estimate cost of a run in plan mode
+        self.api_calls: int = 0
+        self.api_time: float = 0.0
+
     def __authenticate(self) -> discovery.Resource:
         """
         Authenticates user session using Drive API.
@@ -61,6 +68,28 @@ class DriveHandler:
 
         return googleapiclient.discovery.build("drive", "v3", credentials=creds)
 
+    def __execute(self, request: googleapiclient.http.HttpRequest) -> Dict[str, Any]:
+        """
+        Executes a request made to the Drive API - tracking the number of calls made,
+        and the time spent waiting on them
+        """
+
+        start = perf_counter()
+        try:
+            return request.execute()
+        finally:
+            self.api_calls += 1
+            self.api_time += perf_counter() - start
+
+    @property
+    def avg_latency(self) -> float:
+        """
+        Average time (in seconds) taken by a call to the Drive API, zero if no calls
+        have been made so far
+        """
+
+        return self.api_time / self.api_calls if self.api_calls else 0.0
+
     def __get_teamdrives(self) -> Dict[str, str]:
         """
         Fetches and returns a list of all teamdrives associated with the Google account
@@ -79,10 +108,8 @@ class DriveHandler:
         tds: Dict[str, str] = {}
         while next_page_token or first_run:
             first_run = False
-            page_content: Dict[str, Any] = (
-                self.resource.drives()
-                .list(pageSize=100, pageToken=next_page_token)
-                .execute()
+            page_content: Dict[str, Any] = self.__execute(
+                self.resource.drives().list(pageSize=100, pageToken=next_page_token)
             )
 
             for item in page_content["drives"]:
@@ -123,15 +150,13 @@ class DriveHandler:
         """
 
         try:
-            result = (
-                self.resource.files()
-                .get(fileId=dir_id, supportsAllDrives=True)
-                .execute()
+            result = self.__execute(
+                self.resource.files().get(fileId=dir_id, supportsAllDrives=True)
             )
 
             if result.get("id", True) == result.get("teamDriveId", None):
                 # Enters this block only if the `dir_id` belongs to a teamdrive
-                result = self.resource.drives().get(driveId=dir_id).execute()
+                result = self.__execute(self.resource.drives().get(driveId=dir_id))
 
             # Cache directory name -- works with teamdrives and folders, id's are unique
             self.dirs[result["id"]] = result["name"]
@@ -232,9 +257,8 @@ class DriveHandler:
             dir_id, path, dir_name = queue.pop()
             change_dir(path, dir_name)
 
-            page = (
-                self.resource.files()
-                .list(
+            page = self.__execute(
+                self.resource.files().list(
                     pageSize=1000,  # get max items possible with each call
                     pageToken=page_token,  # decides page for pagination
                     fields="files(name, id, mimeType, teamDriveId, driveId, size)",
@@ -243,7 +267,6 @@ class DriveHandler:
                     # Ensure items are in parent directory, exclude deleted items
                     q=f"'{dir_id}' in parents and trashed=false",
                 )
-                .execute()
             )
 
             for item in page["files"]:
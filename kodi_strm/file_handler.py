@@ -1,8 +1,9 @@
 from os import mkdir
+from os import walk as walk_dir
 from os.path import exists as path_exists
 from os.path import join as join_path
 from os.path import splitext
-from typing import Optional
+from typing import Optional, Set
 
 import typer
 from reprint import output
@@ -15,6 +16,7 @@ class FileHandler:
         include_extensions: bool,
         live_updates: bool,
         outstream: output = None,
+        plan: bool = False,
     ) -> None:
         self.__cur_path: str = destination
         self.__cur_dir: str = None
@@ -30,6 +32,11 @@ class FileHandler:
 
         self.__outstream = outstream
 
+        # In plan mode, nothing is written to the disk -- complete paths to `.strm`
+        # files that would have been generated are tracked instead
+        self.__plan = plan
+        self.__planned: Set[str] = set()
+
     @staticmethod
     def __readable_size(size: int) -> str:
         """
@@ -164,6 +171,11 @@ class FileHandler:
             else f"{splitext(item_name)[0]}.strm"  # remove extension if not needed
         )
 
+        if self.__plan:
+            # Plan mode, track the file instead of creating it
+            self.__planned.add(join_path(self.__cur_path, file_name))
+            return True
+
         # Create strm file, and write to it
         with open(join_path(self.__cur_path, file_name), "w+") as f:
             f.write(file_contents)
@@ -171,7 +183,10 @@ class FileHandler:
         return True
 
     def switch_dir(self, path: str, dir_name: str):
-        if not path_exists(path):
+        if self.__plan:
+            # Root directory is wiped before an actual run, every directory is created
+            self.__directories += 1
+        elif not path_exists(path):
             mkdir(path=path)
             self.__directories += 1
 
@@ -210,3 +225,32 @@ class FileHandler:
             self.__size += item_size
             self.__files += 1
             self.__update()
+
+    def plan_report(self, root: str) -> str:
+        """
+        Compares the `.strm` files tracked in plan mode against the contents of the
+        existing `root` directory, and returns a summary of the planned changes
+
+        Remarks
+        --------
+        An actual run wipes the `root` directory (if it exists) before generating files.
+        Existing files that would be generated again are counted as updates, the rest
+        of the existing files are counted as deletions
+
+        Params
+        -------
+        root: Complete path to the local root directory for the run
+        """
+
+        existing: Set[str] = set()
+        for dir_path, _, files in walk_dir(root):
+            existing.update(join_path(dir_path, file) for file in files)
+
+        return (
+            f"Files to create: {len(self.__planned - existing)}\n"
+            + f"Files to update: {len(self.__planned & existing)}\n"
+            + f"Files to delete: {len(existing - self.__planned)}\n"
+            + f"Directories to create: {self.__directories}\n"
+            + f"Files skipped: {self.__skipped}\n"
+            + f"Media covered: {self.__readable_size(self.__size)}"
+        )